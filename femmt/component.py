@@ -82,6 +82,7 @@ class MagneticComponent:
 
         # Create file paths class in order to handle all paths
         self.file_data: FileData = FileData(working_directory)
+        self.file_data.create_folder_structure()
         # Clear result folder structure in case of missing
         if clean_previous_results:
             self.file_data.clear_previous_simulation_results()
@@ -1,6 +1,7 @@
 """Contains information about the file structure."""
 # Python standard libraries
 import os
+from functools import cached_property
 
 import numpy as np
 from typing import List
@@ -10,6 +11,9 @@ from femmt.enumerations import ConductorType
 from femmt.model import Conductor
 from typing import Optional
 
+# Folder of the femmt package, independent of the working directory
+FEMMT_FOLDER_PATH = os.path.dirname(__file__)
+
 
 class FileData:
     """Contains paths to every folder and file needed in femmt."""
@@ -22,9 +26,8 @@ class FileData:
     @staticmethod
     def create_folders(*args) -> None:
         """Create folders for every given folder path (if it does not exist)."""
-        for folder in list(args):
-            if not os.path.exists(folder):
-                os.mkdir(folder)
+        for folder in args:
+            os.makedirs(folder, exist_ok=True)
 
     def clear_previous_simulation_results(self):
         """
@@ -34,10 +37,10 @@ class FileData:
         (Parameter.pro, core_materials_temp.pro are cleaned up.
         """
         self.clean_folder_structure(self.results_folder_path)
-        if os.path.exists(os.path.join(self.electro_magnetic_folder_path, "core_materials_temp.pro")):
-            os.remove(os.path.join(self.electro_magnetic_folder_path, "core_materials_temp.pro"))
-        if os.path.exists(os.path.join(self.electro_magnetic_folder_path, "Parameter.pro")):
-            os.remove(os.path.join(self.electro_magnetic_folder_path, "Parameter.pro"))
+        for file_name in ["core_materials_temp.pro", "Parameter.pro"]:
+            file_path = os.path.join(self.electro_magnetic_folder_path, file_name)
+            if os.path.exists(file_path):
+                os.remove(file_path)
 
     @staticmethod
     def clean_folder_structure(folder_path: str):
@@ -55,6 +58,9 @@ class FileData:
     def update_paths(self, working_directory: str, electro_magnetic_folder_path: str = None, strands_coefficients_folder_path: str = None) -> None:
         """Set the local path based on the given working directory.
 
+        All other folder and file paths are derived from these base paths on first access.
+        The folders are not created here, use create_folder_structure() for this.
+
         :param working_directory: working directory folder path
         :type working_directory: str
         :param electro_magnetic_folder_path: folder path to electro magnetic simulation folders
@@ -62,48 +68,146 @@ class FileData:
         :param strands_coefficients_folder_path: folder path to strand coefficients
         :type strands_coefficients_folder_path: str
         """
-        # Setup folder paths 
+        # Derived paths of a previous working directory are not valid anymore
+        for name, attribute in vars(FileData).items():
+            if isinstance(attribute, cached_property):
+                self.__dict__.pop(name, None)
+
+        # Setup base folder paths
         self.working_directory = working_directory
-        self.femmt_folder_path = os.path.dirname(__file__)
-        self.mesh_folder_path = os.path.join(self.working_directory, "mesh")
+        self.femmt_folder_path = FEMMT_FOLDER_PATH
         if electro_magnetic_folder_path:
             self.electro_magnetic_folder_path = electro_magnetic_folder_path
         else:
             self.electro_magnetic_folder_path = os.path.join(self.femmt_folder_path, "electro_magnetic")
-        self.results_folder_path = os.path.join(self.working_directory, "results")
-        self.e_m_values_folder_path = os.path.join(self.results_folder_path, "values")
-        self.e_m_fields_folder_path = os.path.join(self.results_folder_path, "fields")
-        self.e_m_circuit_folder_path = os.path.join(self.results_folder_path, "circuit")
         if strands_coefficients_folder_path:
             self.e_m_strands_coefficients_folder_path = strands_coefficients_folder_path
         else:
             self.e_m_strands_coefficients_folder_path = os.path.join(self.electro_magnetic_folder_path, "Strands_Coefficients")
-        self.femm_folder_path = os.path.join(self.working_directory, "femm")
-        self.reluctance_model_folder_path = os.path.join(self.working_directory, "reluctance_model")
-        self.thermal_results_folder_path = os.path.join(self.results_folder_path, "thermal")
-
-        # Setup file paths
-        self.e_m_results_log_path = os.path.join(self.results_folder_path, "log_electro_magnetic.json")
-        self.coordinates_description_log_path = os.path.join(self.results_folder_path, "log_coordinates_description.json")
-        self.material_log_path = os.path.join(self.results_folder_path, "log_material.json")
-        self.femm_results_log_path = os.path.join(self.femm_folder_path, "result_log_femm.json")
-        self.config_path = os.path.join(self.femmt_folder_path, "config.json")
-        self.e_m_mesh_file = os.path.join(self.mesh_folder_path, "electro_magnetic.msh")
-        self.model_geo_file = os.path.join(self.mesh_folder_path, "model.geo_unrolled")
-        self.hybrid_mesh_file = os.path.join(self.mesh_folder_path, "hybrid.msh")
-        self.hybrid_color_mesh_file = os.path.join(self.mesh_folder_path, "hybrid_color.msh")
-        self.hybrid_color_visualize_file = os.path.join(self.mesh_folder_path, "hybrid_color.png")
-        self.thermal_mesh_file = os.path.join(self.mesh_folder_path, "thermal.msh")
-        self.results_em_simulation = os.path.join(self.mesh_folder_path, "results.png")
-        self.gmsh_log = os.path.join(self.results_folder_path, "log_gmsh.txt")
-        self.getdp_log = os.path.join(self.results_folder_path, "log_getdp.txt")
-        self.femmt_log = os.path.join(self.results_folder_path, "log_femmt.txt")
-
-        # Create necessary folders
-        self.create_folders(self.femmt_folder_path, self.mesh_folder_path, self.electro_magnetic_folder_path, 
+
+    def create_folder_structure(self) -> None:
+        """Create all folders which are necessary for a simulation (if they do not exist)."""
+        self.create_folders(self.femmt_folder_path, self.mesh_folder_path, self.electro_magnetic_folder_path,
                             self.results_folder_path, self.e_m_values_folder_path, self.e_m_fields_folder_path,
                             self.e_m_circuit_folder_path, self.e_m_strands_coefficients_folder_path)
 
+    # Folder paths
+    @cached_property
+    def mesh_folder_path(self) -> str:
+        """Folder path for the mesh files."""
+        return os.path.join(self.working_directory, "mesh")
+
+    @cached_property
+    def results_folder_path(self) -> str:
+        """Folder path for the simulation results."""
+        return os.path.join(self.working_directory, "results")
+
+    @cached_property
+    def e_m_values_folder_path(self) -> str:
+        """Folder path for the electro magnetic result values."""
+        return os.path.join(self.results_folder_path, "values")
+
+    @cached_property
+    def e_m_fields_folder_path(self) -> str:
+        """Folder path for the electro magnetic result fields."""
+        return os.path.join(self.results_folder_path, "fields")
+
+    @cached_property
+    def e_m_circuit_folder_path(self) -> str:
+        """Folder path for the electro magnetic circuit results."""
+        return os.path.join(self.results_folder_path, "circuit")
+
+    @cached_property
+    def femm_folder_path(self) -> str:
+        """Folder path for the FEMM simulation."""
+        return os.path.join(self.working_directory, "femm")
+
+    @cached_property
+    def reluctance_model_folder_path(self) -> str:
+        """Folder path for the reluctance model."""
+        return os.path.join(self.working_directory, "reluctance_model")
+
+    @cached_property
+    def thermal_results_folder_path(self) -> str:
+        """Folder path for the thermal simulation results."""
+        return os.path.join(self.results_folder_path, "thermal")
+
+    # File paths
+    @cached_property
+    def e_m_results_log_path(self) -> str:
+        """File path of the electro magnetic result log."""
+        return os.path.join(self.results_folder_path, "log_electro_magnetic.json")
+
+    @cached_property
+    def coordinates_description_log_path(self) -> str:
+        """File path of the coordinates description log."""
+        return os.path.join(self.results_folder_path, "log_coordinates_description.json")
+
+    @cached_property
+    def material_log_path(self) -> str:
+        """File path of the material log."""
+        return os.path.join(self.results_folder_path, "log_material.json")
+
+    @cached_property
+    def femm_results_log_path(self) -> str:
+        """File path of the FEMM result log."""
+        return os.path.join(self.femm_folder_path, "result_log_femm.json")
+
+    @cached_property
+    def config_path(self) -> str:
+        """File path of the femmt config file."""
+        return os.path.join(self.femmt_folder_path, "config.json")
+
+    @cached_property
+    def e_m_mesh_file(self) -> str:
+        """File path of the electro magnetic mesh."""
+        return os.path.join(self.mesh_folder_path, "electro_magnetic.msh")
+
+    @cached_property
+    def model_geo_file(self) -> str:
+        """File path of the unrolled model geometry."""
+        return os.path.join(self.mesh_folder_path, "model.geo_unrolled")
+
+    @cached_property
+    def hybrid_mesh_file(self) -> str:
+        """File path of the hybrid mesh."""
+        return os.path.join(self.mesh_folder_path, "hybrid.msh")
+
+    @cached_property
+    def hybrid_color_mesh_file(self) -> str:
+        """File path of the colored hybrid mesh."""
+        return os.path.join(self.mesh_folder_path, "hybrid_color.msh")
+
+    @cached_property
+    def hybrid_color_visualize_file(self) -> str:
+        """File path of the colored hybrid mesh picture."""
+        return os.path.join(self.mesh_folder_path, "hybrid_color.png")
+
+    @cached_property
+    def thermal_mesh_file(self) -> str:
+        """File path of the thermal mesh."""
+        return os.path.join(self.mesh_folder_path, "thermal.msh")
+
+    @cached_property
+    def results_em_simulation(self) -> str:
+        """File path of the electro magnetic simulation result picture."""
+        return os.path.join(self.mesh_folder_path, "results.png")
+
+    @cached_property
+    def gmsh_log(self) -> str:
+        """File path of the gmsh log."""
+        return os.path.join(self.results_folder_path, "log_gmsh.txt")
+
+    @cached_property
+    def getdp_log(self) -> str:
+        """File path of the getdp log."""
+        return os.path.join(self.results_folder_path, "log_getdp.txt")
+
+    @cached_property
+    def femmt_log(self) -> str:
+        """File path of the femmt log."""
+        return os.path.join(self.results_folder_path, "log_femmt.txt")
+
 
 class MeshData:
     """Contains data which is needed for the mesh generation. Is updated by high_level_geo_gen."""
@@ -112,8 +216,8 @@ class MeshData:
     skin_mesh_factor: float
     c_core: float
     c_window: float
-    c_conductor = List[float]
-    c_center_conductor = List[float]
+    c_conductor: np.ndarray
+    c_center_conductor: np.ndarray
     c_air_gaps: float
     
     center_factor: float
@@ -146,9 +250,14 @@ class MeshData:
         self.window_w = window_w
         self.windings = windings
 
-        # Empty lists
-        self.c_conductor = [None] * len(windings)
-        self.c_center_conductor = [None] * len(windings)
+        # Mesh sizes per winding, filled by update_data()
+        self.c_conductor = np.zeros(len(windings))
+        self.c_center_conductor = np.zeros(len(windings))
+
+        # Conductor data as arrays, so the mesh sizes of all windings are calculated at once
+        self.conductor_types = np.array([winding.conductor_type for winding in windings])
+        self.conductor_sizes = np.array([winding.conductor_radius if winding.conductor_type in [ConductorType.RoundSolid, ConductorType.RoundLitz]
+                                         else winding.thickness for winding in windings], dtype=float)
 
         self.c_core = core_w / 10 * self.mesh_accuracy_core
         self.c_window = window_w / 30 * self.mesh_accuracy_window
@@ -170,14 +279,12 @@ class MeshData:
                 self.delta = 1e9
             else:
                 self.delta = np.sqrt(2 / (2 * frequency * np.pi * self.windings[0].cond_sigma * self.mu0))
-            for i in range(len(self.windings)):
-                if self.windings[i].conductor_type == ConductorType.RoundSolid:
-                    self.c_conductor[i] = min([self.delta * self.skin_mesh_factor, self.windings[i].conductor_radius / 4 * self.mesh_accuracy_conductor])
-                    # * self.mesh.skin_mesh_factor])
-                    self.c_center_conductor[i] = self.windings[i].conductor_radius / 4 * self.mesh_accuracy_conductor  # * self.mesh.skin_mesh_factor
-                elif self.windings[i].conductor_type == ConductorType.RoundLitz:
-                    self.c_conductor[i] = self.windings[i].conductor_radius / 4 * self.mesh_accuracy_conductor
-                    self.c_center_conductor[i] = self.windings[i].conductor_radius / 4 * self.mesh_accuracy_conductor
-                else:
-                    self.c_conductor[i] = self.windings[i].thickness / 4 * self.mesh_accuracy_conductor  # TODO: dynamic implementation
-                    self.c_center_conductor[i] = self.center_factor * self.windings[i].thickness / 4 * self.mesh_accuracy_conductor
+
+            # Round conductors are meshed by their radius, all other conductors by their thickness
+            c_conductor_base = self.conductor_sizes / 4 * self.mesh_accuracy_conductor
+            is_round = (self.conductor_types == ConductorType.RoundSolid) | (self.conductor_types == ConductorType.RoundLitz)
+            self.c_conductor[:] = c_conductor_base
+            # Only solid round conductors are limited by the skin depth
+            np.minimum(self.c_conductor, self.delta * self.skin_mesh_factor, out=self.c_conductor,
+                       where=self.conductor_types == ConductorType.RoundSolid)
+            self.c_center_conductor[:] = np.where(is_round, c_conductor_base, self.center_factor * c_conductor_base)  # TODO: dynamic implementation
@@ -6,6 +6,7 @@ import subprocess
 import sys
 import os
 import warnings
+from functools import lru_cache
 from typing import Union, List, Tuple, Dict
 from scipy.integrate import quadrature
 
@@ -387,10 +388,13 @@ def litz_database() -> Dict:
     return litz_dict
 
 
+@lru_cache(maxsize=1)
 def wire_material_database() -> Dict[str, WireMaterial]:
     """
     Return wire materials e.g. copper, aluminium in a dictionary.
 
+    The dictionary is only created once and shared by all callers (e.g. every Conductor), so it must not be modified.
+
     :return: Dict with materials and conductivity
     :rtype: Dict
     """
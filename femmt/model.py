@@ -3,8 +3,10 @@
 Conductors, Core, AirGaps, Insulations, WindingWindow, StrayPath and the VirtualWindingWindow.
 """
 # Python standard libraries
+import bisect
+import math
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional, Union
 
 # 3rd party libraries
 import numpy as np
@@ -29,23 +31,33 @@ class Conductor:
     """
 
     # TODO More documentation
+    # Default values are set in __init__(), as slots can not have class level defaults
+    __slots__ = ("conductor_type", "conductor_arrangement", "wrap_para", "conductor_radius", "winding_number", "thickness", "ff",
+                 "strand_radius", "n_strands", "n_layers", "a_cell", "cond_sigma", "conductor_is_set", "parallel", "conductivity")
+
     conductor_type: ConductorType
-    conductor_arrangement: Optional[ConductorArrangement] = None
-    wrap_para: Optional[WrapParaType] = None
-    conductor_radius: Optional[float] = None
+    conductor_arrangement: Optional[ConductorArrangement]
+    wrap_para: Optional[WrapParaType]
+    conductor_radius: Optional[float]
     winding_number: int
-    thickness: Optional[float] = None
-    ff: Optional[float] = None
-    strand_radius: Optional[float] = None
-    n_strands: int = 0
+    thickness: Optional[float]
+    ff: Optional[float]
+    strand_radius: Optional[float]
+    n_strands: int
     n_layers: int
     a_cell: float
     cond_sigma: float
 
     conductor_is_set: bool
+    parallel: bool
 
     # Not used in femmt_classes. Only needed for to_dict()
-    conductivity: Optional[Conductivity] = None
+    conductivity: Optional[Conductivity]
+
+    # Attributes which are compared by __eq__ and __ne__
+    _comparison_attributes = ("winding_number", "conductivity", "parallel", "cond_sigma", "conductor_is_set", "conductor_type",
+                              "conductor_arrangement", "conductor_radius", "thickness", "n_strands", "strand_radius", "ff",
+                              "n_layers", "a_cell")
 
     def __init__(self, winding_number: int, conductivity: Conductivity, parallel: bool = False,
                  winding_material_temperature: float = 100):
@@ -71,6 +83,15 @@ class Conductor:
         self.conductor_is_set = False
         self.parallel = parallel
 
+        # Set by set_rectangular_conductor(), set_solid_round_conductor() or set_litz_round_conductor()
+        self.conductor_arrangement = None
+        self.wrap_para = None
+        self.conductor_radius = None
+        self.thickness = None
+        self.ff = None
+        self.strand_radius = None
+        self.n_strands = 0
+
         dict_material_database = ff.wire_material_database()
         if conductivity.name in dict_material_database:
             self.cond_sigma = ff.conductivity_temperature(conductivity.name, winding_material_temperature)
@@ -97,7 +118,7 @@ class Conductor:
         self.conductor_type = ConductorType.RoundSolid
         self.conductor_arrangement = conductor_arrangement
         self.conductor_radius = conductor_radius
-        self.a_cell = np.pi * conductor_radius ** 2
+        self.a_cell = math.pi * conductor_radius ** 2
 
     def set_litz_round_conductor(self, conductor_radius: Optional[float], number_strands: Optional[int],
                                  strand_radius: Optional[float],
@@ -121,27 +142,35 @@ class Conductor:
         if number_strands is None:
             self.n_strands = int(conductor_radius ** 2 / strand_radius ** 2 * fill_factor)
         elif conductor_radius is None:
-            self.conductor_radius = np.sqrt(number_strands * strand_radius ** 2 / fill_factor)
+            self.conductor_radius = math.sqrt(number_strands * strand_radius ** 2 / fill_factor)
         elif fill_factor is None:
             ff_exact = number_strands * strand_radius ** 2 / conductor_radius ** 2
-            self.ff = np.around(ff_exact, decimals=2)
+            self.ff = float(np.around(ff_exact, decimals=2))
             if self.ff > 0.90:
                 raise Exception(f"A fill factor of {self.ff} is unrealistic!")
         elif strand_radius is None:
-            self.strand_radius = np.sqrt(conductor_radius ** 2 * fill_factor / number_strands)
+            self.strand_radius = math.sqrt(conductor_radius ** 2 * fill_factor / number_strands)
         else:
             raise Exception("1 of the 4 parameters need to be None.")
 
         self.n_layers = ff.litz_calculate_number_layers(number_strands)
-        self.a_cell = self.n_strands * self.strand_radius ** 2 * np.pi / self.ff
+        self.a_cell = self.n_strands * self.strand_radius ** 2 * math.pi / self.ff
+
+    def _comparison_key(self) -> tuple:
+        """Return the attributes which define a conductor as a tuple. Attributes which are not set yet are None."""
+        return tuple(getattr(self, name, None) for name in self._comparison_attributes)
 
     def __eq__(self, other):
         """Define how to compare two conductor objects."""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Conductor):
+            return NotImplemented
+        return self._comparison_key() == other._comparison_key()
 
     def __ne__(self, other):
         """Define how to use the not-equal method for conductor objects."""
-        return self.__dict__ != other.__dict__
+        if not isinstance(other, Conductor):
+            return NotImplemented
+        return self._comparison_key() != other._comparison_key()
 
     def to_dict(self):
         """Transfer object parameters to a dictionary. Important method to create the final result-log."""
@@ -167,6 +196,19 @@ class Core:
     frequency > 0: mu_r_abs is used
     """
 
+    # Additional keywords which are accepted by __init__() and set as attributes.
+    # frequency and re_mu_rel are used by the examples, the dimensions and correct_outer_leg are passed by
+    # MagneticComponent.decode_settings_from_log() when restoring a core from a result log.
+    _allowed_kwargs = ("frequency", "re_mu_rel", "core_inner_diameter", "core_h", "window_w", "window_h", "window_h_bot",
+                       "window_h_top", "correct_outer_leg")
+
+    __slots__ = ("core_type", "core_inner_diameter", "window_w", "window_h", "window_h_bot", "window_h_top", "core_h",
+                 "core_h_center_leg", "core_thickness", "correct_outer_leg", "number_core_windows", "r_inner", "r_outer",
+                 "material_database", "material", "file_path_to_solver_folder", "temperature", "permeability",
+                 "permeability_type", "non_linear", "mu_r_abs", "phi_mu_deg", "loss_approach", "complex_permittivity",
+                 "permittivity", "sigma", "ki", "alpha", "beta", "steinmetz_loss", "generalized_steinmetz_loss",
+                 "mdb_verbosity", "kwargs", "frequency", "re_mu_rel")
+
     # Standard material data
     material: str
 
@@ -179,11 +221,11 @@ class Core:
     # Permitivity - [Conductivity in a magneto-quasistatic sense]
     sigma: complex  # complex equivalent permittivity [frequency-dependent], real and imaginary part
 
-    steinmetz_loss: int = 0
-    generalized_steinmetz_loss: int = 0
+    steinmetz_loss: int
+    generalized_steinmetz_loss: int
 
     # Needed for to_dict
-    loss_approach: LossApproach = None
+    loss_approach: LossApproach
 
     # Database
     # material_database is variable to load in material_database
@@ -222,7 +264,7 @@ class Core:
                  steinmetz_parameter: list = None,
                  generalized_steinmetz_parameter: list = None,
                  mdb_verbosity: Verbosity = Verbosity.Silent,
-                 **kwargs):  # TODO Is this kwargs really needed? Can this be removed?
+                 **kwargs):
         """Initialize the core.
 
         :param core_inner_diameter: diameter of the inner core
@@ -244,7 +286,13 @@ class Core:
         :param detailed_core_model: Manual correction so cross-section of inner leg is not same as outer leg (PQ 40/40 only!!), defaults to False (recommended!)
         :type detailed_core_model: bool, optional
         """
+        unknown_kwargs = set(kwargs) - set(self._allowed_kwargs)
+        if unknown_kwargs:
+            raise TypeError(f"Core got unexpected keyword arguments: {', '.join(sorted(unknown_kwargs))}")
+
         self.mdb_verbosity = mdb_verbosity
+        self.steinmetz_loss = 0
+        self.generalized_steinmetz_loss = 0
 
         # Set parameters
         self.core_type = core_type  # Basic shape of magnetic conductor
@@ -369,8 +417,7 @@ class Core:
         else:
             raise Exception("Loss approach {loss_approach.value} is not implemented")
 
-        # Set attributes of core with given keywords
-        # TODO Should we allow this? Technically this is not how an user interface should be designed
+        # Set attributes of core with given keywords (only _allowed_kwargs, see check above)
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -483,6 +530,7 @@ class AirGaps:
     core: Core
     midpoints: List[List[float]]  #: list: [position_tag, air_gap_position, air_gap_h]
     number: int
+    _air_gap_bounds: Dict[int, List[Tuple[float, float, int]]]  # per leg: sorted (bot_bound, top_bound, midpoint index)
 
     # Needed for to_dict
     air_gap_settings: List
@@ -502,6 +550,7 @@ class AirGaps:
         self.midpoints = []
         self.number = 0
         self.air_gap_settings = []
+        self._air_gap_bounds = {}
 
     def add_air_gap(self, leg_position: AirGapLegPosition, height: float, position_value: Optional[float] = 0,
                     stacked_position: StackedPosition = None):
@@ -517,17 +566,6 @@ class AirGaps:
         :param stacked_position: Top, Bot
         :type stacked_position: StackedPosition
         """
-        self.air_gap_settings.append({
-            "leg_position": leg_position.name,
-            "position_value": position_value,
-            "height": height,
-            "stacked_position": stacked_position})
-
-        for index, midpoint in enumerate(self.midpoints):
-            if midpoint[0] == leg_position and midpoint[1] + midpoint[2] < position_value - height \
-                    and midpoint[1] - midpoint[2] > position_value + height:
-                raise Exception(f"Air gaps {index} and {len(self.midpoints)} are overlapping")
-
         if leg_position == AirGapLegPosition.LeftLeg or leg_position == AirGapLegPosition.RightLeg:
             raise Exception("Currently the leg positions LeftLeg and RightLeg are not supported")
 
@@ -535,12 +573,10 @@ class AirGaps:
             if self.number >= 1:
                 raise Exception("The 'center' position for air gaps can only have 1 air gap maximum")
             else:
-                self.midpoints.append([0, 0, height])
-                self.number += 1
+                self._add_midpoint(0, 0, height)
 
         elif self.method == AirGapMethod.Manually:
-            self.midpoints.append([leg_position.value, position_value, height])
-            self.number += 1
+            self._add_midpoint(leg_position.value, position_value, height)
 
         elif self.method == AirGapMethod.Percent:
             if position_value > 100 or position_value < 0:
@@ -553,22 +589,52 @@ class AirGaps:
             elif position - height / 2 < -self.core.window_h / 2:
                 position += -self.core.window_h / 2 - (position - height / 2)
 
-            self.midpoints.append([leg_position.value, position, height])
-            self.number += 1
+            self._add_midpoint(leg_position.value, position, height)
 
         elif self.method == AirGapMethod.Stacked:
             # set midpoints
             # TODO: handle top and bot
             if stacked_position == StackedPosition.Bot:
-                self.midpoints.append([0, 0, height])
-                self.number += 1
+                self._add_midpoint(0, 0, height)
             if stacked_position == StackedPosition.Top:
-                self.midpoints.append([0, self.core.window_h_bot / 2 + self.core.core_thickness + height / 2, height])
-                self.number += 1
+                self._add_midpoint(0, self.core.window_h_bot / 2 + self.core.core_thickness + height / 2, height)
 
         else:
             raise Exception(f"Method {self.method} is not supported.")
 
+        # Only store the settings of air gaps which have been accepted
+        self.air_gap_settings.append({
+            "leg_position": leg_position.name,
+            "position_value": position_value,
+            "height": height,
+            "stacked_position": stacked_position})
+
+    def _add_midpoint(self, leg_position_value: int, position: float, height: float):
+        """
+        Add the midpoint of an air gap after checking that it does not overlap with another air gap in the same leg.
+
+        The air gap bounds of every leg are kept sorted, so only the direct neighbours need to be checked.
+
+        :param leg_position_value: value of the AirGapLegPosition
+        :type leg_position_value: int
+        :param position: air gap position in [m]
+        :type position: float
+        :param height: air gap height in [m]
+        :type height: float
+        """
+        leg_bounds = self._air_gap_bounds.setdefault(leg_position_value, [])
+        bot_bound = position - height / 2
+        top_bound = position + height / 2
+
+        insert_index = bisect.bisect(leg_bounds, (bot_bound, top_bound))
+        for neighbour_bot_bound, neighbour_top_bound, index in leg_bounds[max(insert_index - 1, 0):insert_index + 1]:
+            if bot_bound < neighbour_top_bound and neighbour_bot_bound < top_bound:
+                raise Exception(f"Air gaps {index} and {len(self.midpoints)} are overlapping")
+
+        leg_bounds.insert(insert_index, (bot_bound, top_bound, len(self.midpoints)))
+        self.midpoints.append([leg_position_value, position, height])
+        self.number += 1
+
     def to_dict(self):
         """Transfer object parameters to a dictionary. Important method to create the final result-log."""
         if self.number == 0:
@@ -699,6 +765,9 @@ class VirtualWindingWindow:
     An instance of this class will be automatically created when the Winding is added to the MagneticComponent
     """
 
+    __slots__ = ("bot_bound", "top_bound", "left_bound", "right_bound", "winding_type", "winding_scheme", "wrap_para", "windings",
+                 "turns", "winding_is_set", "winding_insulation", "placing_strategy", "alignment", "zigzag")
+
     # Rectangular frame:
     bot_bound: float
     top_bound: float
@@ -981,92 +1050,71 @@ class WindingWindow:
                 self.max_bot_bound - self.max_top_bound) * horizontal_split_factor
             vertical_split = self.max_left_bound + (self.max_right_bound - self.max_left_bound) * vertical_split_factor
 
-        # Check for every possible split type and return the corresponding VirtualWindingWindows
-        if split_type == WindingWindowSplit.NoSplit:
-
-            complete = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=self.max_top_bound,
-                left_bound=self.max_left_bound,
-                right_bound=self.max_right_bound)
-
-            self.virtual_winding_windows = [complete]
-            return complete
-        elif split_type == WindingWindowSplit.NoSplitWithBobbin:
-            bobbin_def = [top_bobbin, bot_bobbin, left_bobbin, right_bobbin]
-            for index, element in enumerate(bobbin_def):
-                if element is not None and element > self.insulations.core_cond[index]:
-                    bobbin_def[index] = self.insulations.core_cond[index] - element
-                else:
-                    bobbin_def[index] = 0
-
-            complete = VirtualWindingWindow(
-                top_bound=self.max_top_bound + bobbin_def[0],
-                bot_bound=self.max_bot_bound - bobbin_def[1],
-                left_bound=self.max_left_bound - bobbin_def[2],
-                right_bound=self.max_right_bound + bobbin_def[3])
-            self.virtual_winding_windows = [complete]
-            return complete
-
-        elif split_type == WindingWindowSplit.VerticalSplit:
-            right = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=self.max_top_bound,
-                left_bound=vertical_split + split_distance / 2,
-                right_bound=self.max_right_bound)
-
-            left = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=self.max_top_bound,
-                left_bound=self.max_left_bound,
-                right_bound=vertical_split - split_distance / 2)
-
-            self.virtual_winding_windows = [left, right]
-            return left, right
-        elif split_type == WindingWindowSplit.HorizontalSplit:
-            top = VirtualWindingWindow(
-                bot_bound=horizontal_split + split_distance / 2,
-                top_bound=self.max_top_bound,
-                left_bound=self.max_left_bound,
-                right_bound=self.max_right_bound)
-
-            bot = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=horizontal_split - split_distance / 2,
-                left_bound=self.max_left_bound,
-                right_bound=self.max_right_bound)
-
-            self.virtual_winding_windows = [top, bot]
-            return top, bot
-        elif split_type == WindingWindowSplit.HorizontalAndVerticalSplit:
-            top_left = VirtualWindingWindow(
-                bot_bound=horizontal_split + split_distance / 2,
-                top_bound=self.max_top_bound,
-                left_bound=self.max_left_bound,
-                right_bound=vertical_split - split_distance / 2)
-
-            top_right = VirtualWindingWindow(
-                bot_bound=horizontal_split + split_distance / 2,
-                top_bound=self.max_top_bound,
-                left_bound=vertical_split + split_distance / 2,
-                right_bound=self.max_right_bound)
-
-            bot_left = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=horizontal_split - split_distance / 2,
-                left_bound=self.max_left_bound,
-                right_bound=vertical_split - split_distance / 2)
-
-            bot_right = VirtualWindingWindow(
-                bot_bound=self.max_bot_bound,
-                top_bound=horizontal_split - split_distance / 2,
-                left_bound=vertical_split + split_distance / 2,
-                right_bound=self.max_right_bound)
-
-            self.virtual_winding_windows = [top_left, top_right, bot_left, bot_right]
-            return top_left, top_right, bot_left, bot_right
-        else:
+        # Collect the bounds [bot, top, left, right] of the VirtualWindingWindows for the given split type
+        split_bounds_builder = self._split_bounds_builders.get(split_type)
+        if split_bounds_builder is None:
             raise Exception(f"Winding window split type {split_type} not found")
+        vww_bounds = split_bounds_builder(self, horizontal_split, vertical_split, split_distance,
+                                          [top_bobbin, bot_bobbin, left_bobbin, right_bobbin])
+
+        self.virtual_winding_windows = [VirtualWindingWindow(bot_bound=bot_bound, top_bound=top_bound, left_bound=left_bound, right_bound=right_bound)
+                                        for bot_bound, top_bound, left_bound, right_bound in vww_bounds]
+
+        if split_type in [WindingWindowSplit.NoSplit, WindingWindowSplit.NoSplitWithBobbin]:
+            return self.virtual_winding_windows[0]
+        return tuple(self.virtual_winding_windows)
+
+    # The following methods return the bounds [bot, top, left, right] of the virtual winding windows for one split type.
+    # All of them share the same signature, so split_window() can look them up in _split_bounds_builders.
+    def _no_split_bounds(self, horizontal_split: float, vertical_split: float, split_distance: float,
+                         bobbin_def: List[Optional[float]]) -> List[List[float]]:
+        """Return the bounds of a single virtual winding window which covers the complete winding window."""
+        return [[self.max_bot_bound, self.max_top_bound, self.max_left_bound, self.max_right_bound]]
+
+    def _no_split_with_bobbin_bounds(self, horizontal_split: float, vertical_split: float, split_distance: float,
+                                     bobbin_def: List[Optional[float]]) -> List[List[float]]:
+        """Return the bounds of a single virtual winding window, reduced by the bobbin [top, bot, left, right]."""
+        for index, element in enumerate(bobbin_def):
+            if element is not None and element > self.insulations.core_cond[index]:
+                bobbin_def[index] = self.insulations.core_cond[index] - element
+            else:
+                bobbin_def[index] = 0
+
+        return [[self.max_bot_bound - bobbin_def[1], self.max_top_bound + bobbin_def[0],
+                 self.max_left_bound - bobbin_def[2], self.max_right_bound + bobbin_def[3]]]
+
+    def _vertical_split_bounds(self, horizontal_split: float, vertical_split: float, split_distance: float,
+                               bobbin_def: List[Optional[float]]) -> List[List[float]]:
+        """Return the bounds of the left and the right virtual winding window."""
+        return [[self.max_bot_bound, self.max_top_bound, self.max_left_bound, vertical_split - split_distance / 2],
+                [self.max_bot_bound, self.max_top_bound, vertical_split + split_distance / 2, self.max_right_bound]]
+
+    def _horizontal_split_bounds(self, horizontal_split: float, vertical_split: float, split_distance: float,
+                                 bobbin_def: List[Optional[float]]) -> List[List[float]]:
+        """Return the bounds of the top and the bottom virtual winding window."""
+        return [[horizontal_split + split_distance / 2, self.max_top_bound, self.max_left_bound, self.max_right_bound],
+                [self.max_bot_bound, horizontal_split - split_distance / 2, self.max_left_bound, self.max_right_bound]]
+
+    def _horizontal_and_vertical_split_bounds(self, horizontal_split: float, vertical_split: float, split_distance: float,
+                                              bobbin_def: List[Optional[float]]) -> List[List[float]]:
+        """Return the bounds of the top_left, top_right, bot_left and bot_right virtual winding window."""
+        top_row_bot_bound = horizontal_split + split_distance / 2
+        bot_row_top_bound = horizontal_split - split_distance / 2
+        left_column_right_bound = vertical_split - split_distance / 2
+        right_column_left_bound = vertical_split + split_distance / 2
+
+        return [[top_row_bot_bound, self.max_top_bound, self.max_left_bound, left_column_right_bound],
+                [top_row_bot_bound, self.max_top_bound, right_column_left_bound, self.max_right_bound],
+                [self.max_bot_bound, bot_row_top_bound, self.max_left_bound, left_column_right_bound],
+                [self.max_bot_bound, bot_row_top_bound, right_column_left_bound, self.max_right_bound]]
+
+    _split_bounds_builders = {
+        WindingWindowSplit.NoSplit: _no_split_bounds,
+        WindingWindowSplit.NoSplitWithBobbin: _no_split_with_bobbin_bounds,
+        WindingWindowSplit.VerticalSplit: _vertical_split_bounds,
+        WindingWindowSplit.HorizontalSplit: _horizontal_split_bounds,
+        WindingWindowSplit.HorizontalAndVerticalSplit: _horizontal_and_vertical_split_bounds,
+    }
 
     def NCellsSplit(self, split_distance: float = 0, horizontal_split_factors: List[float] = None, vertical_split_factor: float = 0.5):
         """
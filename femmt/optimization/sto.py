@@ -208,6 +208,7 @@ class StackedTransformerOptimization:
             # Update directories for each model
             geo.file_data.update_paths(working_directory_single_process, electro_magnetic_directory_single_process,
                                        strands_coefficients_folder_single_process)
+            geo.file_data.create_folder_structure()
 
             core_dimensions = femmt.dtos.StackedCoreDimensions(core_inner_diameter=core_inner_diameter,
                                                                window_w=window_w,
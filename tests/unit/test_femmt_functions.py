@@ -1,4 +1,5 @@
 """Contains Unittests for some subfunctions of FEMMT."""
+import os
 import pytest
 import femmt
 import numpy as np
@@ -149,3 +150,61 @@ def test_conductivity_temperature():
 
     assert copper_sigma_100_degree_calculated == pytest.approx(4.4874e7, rel=1e-3)
     assert aluminium_sigma_100_degree_calculated == pytest.approx(2.8627e7, rel=1e-3)
+
+
+def test_air_gaps_overlapping():
+    """Unittest to check that overlapping air gaps in the same leg are rejected."""
+    air_gaps = femmt.AirGaps(femmt.AirGapMethod.Manually, None)
+    air_gaps.add_air_gap(femmt.AirGapLegPosition.CenterLeg, 0.001, 0.002)
+    air_gaps.add_air_gap(femmt.AirGapLegPosition.CenterLeg, 0.001, -0.002)
+    # touching air gaps do not overlap
+    air_gaps.add_air_gap(femmt.AirGapLegPosition.CenterLeg, 0.001, 0.003)
+    assert air_gaps.number == 3
+
+    with pytest.raises(Exception, match="Air gaps 0 and 3 are overlapping"):
+        air_gaps.add_air_gap(femmt.AirGapLegPosition.CenterLeg, 0.001, 0.0015)
+    assert air_gaps.number == 3
+    assert len(air_gaps.air_gap_settings) == 3
+
+
+def test_file_data_update_paths(tmp_path):
+    """Unittest to check that derived file paths follow a changed working directory."""
+    old_directory = str(tmp_path / "old")
+    new_directory = str(tmp_path / "new")
+
+    file_data = femmt.data.FileData(old_directory)
+    assert not os.path.exists(old_directory)
+
+    assert file_data.results_folder_path == os.path.join(old_directory, "results")
+    assert file_data.e_m_values_folder_path == os.path.join(old_directory, "results", "values")
+
+    file_data.update_paths(new_directory)
+    assert file_data.results_folder_path == os.path.join(new_directory, "results")
+    assert file_data.e_m_values_folder_path == os.path.join(new_directory, "results", "values")
+    assert not os.path.exists(new_directory)
+
+    file_data.create_folder_structure()
+    assert os.path.isdir(file_data.e_m_values_folder_path)
+
+
+def test_core_keyword_arguments():
+    """Unittest to check that the core only accepts known additional keyword arguments."""
+    core_dimensions = femmt.dtos.SingleCoreDimensions(core_inner_diameter=0.015, window_w=0.012, window_h=0.03, core_h=0.04)
+    core_settings = {"mu_r_abs": 3000, "phi_mu_deg": 10, "sigma": 0.5,
+                     "permeability_datasource": femmt.MaterialDataSource.Custom,
+                     "permittivity_datasource": femmt.MaterialDataSource.Custom}
+
+    with pytest.raises(TypeError, match="unexpected keyword arguments: bogus"):
+        femmt.Core(core_dimensions=core_dimensions, bogus=1, **core_settings)
+
+    core = femmt.Core(core_dimensions=core_dimensions, frequency=100e3, **core_settings)
+    assert core.frequency == 100e3
+
+    # The result log stores Core.to_dict(), which is passed back to Core() by decode_settings_from_log()
+    settings = core.to_dict()
+    settings["loss_approach"] = femmt.LossApproach[settings["loss_approach"]]
+    settings["sigma"] = complex(settings["sigma"][0], settings["sigma"][1])
+    settings["permeability_datasource"] = femmt.MaterialDataSource(settings["permeability_datasource"])
+    settings["permittivity_datasource"] = femmt.MaterialDataSource(settings["permittivity_datasource"])
+    decoded_core = femmt.Core(core_dimensions=core_dimensions, **settings)
+    assert decoded_core.to_dict() == core.to_dict()